@@ -1,5 +1,6 @@
 import importlib
 import locale
+import multiprocessing
 import os
 import sys
 
@@ -13,22 +14,29 @@ from src.presenter.main_presenter import MainPresenter
 from src.presenter.welcome_presenter import WelcomePresenter
 from src.utils.window_dialog_utils import WindowDialogUtils
 
-loguru.logger.add(LOG_FILE, rotation="1 day", retention="1 week", level="DEBUG")
 
-# 设置环境变量为PYTHONIOENCODING=utf-8
-os.environ["PYTHONIOENCODING"] = "utf-8"
-os.environ["NUITKA_CACHE_DIR"] = str(DEPENDENCE_DIR)
+def init_environment():
+    """初始化日志和编码
 
-sys.stdout.reconfigure(encoding="utf-8")
-sys.stderr.reconfigure(encoding="utf-8")
+    只能在主进程中调用：multiprocessing 的子进程会以 __mp_main__ 重新导入本文件，
+    放在模块顶层会让每个子进程都重复添加日志、重设编码
+    """
+    loguru.logger.add(LOG_FILE, rotation="1 day", retention="1 week", level="DEBUG")
 
-importlib.reload(sys)
-loguru.logger.debug(
-    f"系统默认编码: {sys.getdefaultencoding()}, 已经重新加载为UTF-8"
-)
+    # 设置环境变量为PYTHONIOENCODING=utf-8
+    os.environ["PYTHONIOENCODING"] = "utf-8"
+    os.environ["NUITKA_CACHE_DIR"] = str(DEPENDENCE_DIR)
 
-# 确保环境变量LANG设置为UTF-8
-locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
+
+    importlib.reload(sys)
+    loguru.logger.debug(
+        f"系统默认编码: {sys.getdefaultencoding()}, 已经重新加载为UTF-8"
+    )
+
+    # 确保环境变量LANG设置为UTF-8
+    locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
 
 
 def is_already_running() -> bool:
@@ -61,4 +69,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包后的 exe 中使用进程池时需要
+    multiprocessing.freeze_support()
+    init_environment()
     main()
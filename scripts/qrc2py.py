@@ -1,8 +1,63 @@
 import subprocess
+import xml.etree.ElementTree as ET
 
-from src.core.paths import QRC_PY_FILE, QRC_FILE
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtSvg import QSvgRenderer
 
+from src.core.paths import PRERENDERED_DIR, PRERENDERED_QRC_FILE, QRC_PY_FILE, QRC_FILE
+from src.core.settings import PRERENDER_ICONS
+
+
+def get_qrc_files() -> dict[str, tuple[str, str, str]]:
+    """读取 qrc，返回 资源路径 -> (prefix, 资源内的相对路径, 相对 qrc 的文件路径)"""
+    qrc_files = {}
+    for qresource in ET.parse(QRC_FILE).getroot().iter('qresource'):
+        prefix = qresource.get('prefix', '/').strip('/')
+        for file in qresource.iter('file'):
+            alias = file.get('alias') or file.text
+            resource_path = f':/{prefix}/{alias}' if prefix else f':/{alias}'
+            qrc_files[resource_path] = (prefix, alias, file.text)
+    return qrc_files
+
+
+def rasterize_svg(svg_file, png_file, size: QSize):
+    """按 svg 原始宽高比缩放到 size 以内并渲染为 png"""
+    renderer = QSvgRenderer(str(svg_file))
+    image = QImage(renderer.defaultSize().scaled(size, Qt.AspectRatioMode.KeepAspectRatio),
+                   QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    png_file.parent.mkdir(parents=True, exist_ok=True)
+    image.save(str(png_file))
+
+
+def write_prerendered_qrc():
+    """渲染 PRERENDER_ICONS 中的 svg，并生成单独的 qrc，不修改原有的 res.qrc
+
+    src/resource/icons.py 只注册 png，QIcon 会自动加载同名的 @2x 文件，启动时不再解析 svg
+    """
+    qrc_files = get_qrc_files()
+    root = ET.Element('RCC')
+    qresources: dict[str, ET.Element] = {}
+    for resource_path, size in PRERENDER_ICONS.items():
+        prefix, alias, file = qrc_files[resource_path]
+        if prefix not in qresources:
+            qresources[prefix] = ET.SubElement(root, 'qresource', prefix=f'/{prefix}')
+        svg_file = QRC_FILE.parent / file
+        for scale, suffix in ((1, ''), (2, '@2x')):
+            png_alias = alias[:-len('.svg')] + f'{suffix}.png'
+            print(f'正在渲染 {png_alias}')
+            rasterize_svg(svg_file, PRERENDERED_DIR / png_alias, QSize(*size) * scale)
+            ET.SubElement(qresources[prefix], 'file', alias=png_alias).text = png_alias
+    ET.ElementTree(root).write(PRERENDERED_QRC_FILE, encoding='utf-8')
+
+
+print('正在预渲染 svg 图标')
+write_prerendered_qrc()
 print('正在编译资源文件')
 # 使用 pyside6-rcc 命令将 qrc 文件编译成 py 文件
-subprocess.run(['pyside6-rcc', str(QRC_FILE), '-o', str(QRC_PY_FILE)])
+subprocess.run(['pyside6-rcc', str(QRC_FILE), str(PRERENDERED_QRC_FILE), '-o', str(QRC_PY_FILE)])
 print('编译完成')
@@ -62,13 +62,13 @@ class PipManager:
         def test_speed(url: str) -> tuple[str, float]:
             host = urllib.parse.urlparse(url).hostname
             port = 80  # 默认 HTTP 端口
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 sock.settimeout(3)  # 设置超时时间
                 sock.connect((host, port))
                 sock.close()
-                response_time = time.time() - start_time
+                response_time = time.perf_counter() - start_time
                 return url, response_time
             except Exception as e:
                 loguru.logger.error(f"连接 {url} 失败: {e}")
@@ -19,6 +19,8 @@ COMMAND_IMPLEMENT_DIR = SRC_DIR / "common" / "nuitka_command" / "command_impleme
 LOG_FILE = PROJECT_DIR / "log.log"
 CONFIG_FILE = PROJECT_DIR / "config.json"
 QRC_FILE = ASSETS_DIR / "res.qrc"
+PRERENDERED_DIR = ASSETS_DIR / "prerendered"
+PRERENDERED_QRC_FILE = PRERENDERED_DIR / "res_prerendered.qrc"
 QRC_PY_FILE = RESOURCE_DIR / "rc_res.py"
 LOGO_FILE = DEPENDENCE_DIR / "logo.ico"
 CCACHE_DEPENDENCE_FILE = DOWNLOADS_DIR / "depends" / "x86_64" / "ccache.exe"
@@ -29,3 +31,5 @@ GCC_EXE_FILE = GCC_DIR / "bin" / "gcc.exe"
 CLANG_EXE_FILE = GCC_DIR / "bin" / "clang.exe"
 DEPENDENCE_SAVE_PATH_FILE = PROJECT_DIR / "dependence_save_path.json"
 NUITKA_CRASH_REPORT_FILE = PROJECT_DIR / "nuitka-crash-report.xml"
+CACHE_DIR = Path.home() / ".cache" / "NuitkaGUI"
+IMPORTS_CACHE_FILE = CACHE_DIR / "imports.pkl"
@@ -12,6 +12,29 @@ IGNORE_DIRS: Sequence[str] = (
     ".idea",
     "node_modules",
 )
+# 查找单个文件（如项目虚拟环境的 python.exe）时不进入的大目录，里面不会有需要查找的文件
+FIND_FILE_IGNORE_DIRS: Sequence[str] = (
+    ".git",
+    ".idea",
+    "__pycache__",
+    "node_modules",
+    "site-packages",
+)
+# 项目中虚拟环境 python.exe 的常见位置（相对于项目目录）
+PROJECT_PYTHON_EXE_CANDIDATES: Sequence[str] = (
+    ".venv/Scripts/python.exe",
+    "venv/Scripts/python.exe",
+    "env/Scripts/python.exe",
+    "Scripts/python.exe",
+    "venv/*/Scripts/python.exe",
+)
+# 打包完成后，间隔多少秒内不再重复打开同一个输出文件夹
+REOPEN_OUTPUT_DIR_INTERVAL: int = 60
+# 需要预渲染成 png 的 svg 资源及其显示尺寸（宽, 高），scripts/qrc2py.py 会同时生成 @2x 版本
+# src/resource/icons.py 也按这张表决定图标是否使用预渲染的 png
+PRERENDER_ICONS: dict[str, tuple[int, int]] = {
+    ":/Icons/materialIcons/software_icon.svg": (100, 100),
+}
 INSTALL_PACKAGE: list[str] = [
     'nuitka'
 ]
@@ -59,9 +59,6 @@ class Ui_Form(object):
         sizePolicy.setHeightForWidth(self.IconWidget.sizePolicy().hasHeightForWidth())
         self.IconWidget.setSizePolicy(sizePolicy)
         self.IconWidget.setMinimumSize(QSize(100, 100))
-        icon = QIcon()
-        icon.addFile(u":/Icons/materialIcons/software_icon.svg", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
-        self.IconWidget.setProperty(u"icon", icon)
 
         self.horizontalLayout.addWidget(self.IconWidget)
 
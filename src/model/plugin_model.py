@@ -20,13 +20,12 @@ class PluginModel:
 
     def get_all_packages_by_py_file(self, py_file: Path) -> List[str]:
         dependence_list: list[str] = []
-        all_py_file_in_dir = self._window_explorer_utils.find_files_in_dir_recursive_by_fnmatch(py_file.parent, '*.py',
-                                                                                                self._window_explorer_utils.FileType.FILES)
-        all_py_file_in_dir = [i for i in all_py_file_in_dir if
-                              not any(self._is_substring_in_path(j, str(i)) for j in IGNORE_DIRS)]
-        for i in all_py_file_in_dir:
-            dependence_list.extend(DependenceUtils().get_import_name_from_py_file(i))
-        return self._command_manager.manager_plugin.filter_plugins(list(set(dependence_list)))
+        all_py_file_in_dir = [Path(entry.path) for entry in
+                              self._window_explorer_utils.iter_file_entries(py_file.parent, IGNORE_DIRS)
+                              if entry.name.endswith('.py')]
+        for import_names in DependenceUtils.get_import_names_for_paths(all_py_file_in_dir).values():
+            dependence_list.extend(import_names)
+        return self._command_manager.manager_plugin.filter_plugins(list(dict.fromkeys(dependence_list)))
 
     def set_plugin_status(self, plugin_name: str, status: bool) -> None:
         self._command_manager.manager_plugin.set_plugin_enable(plugin_name, status)
@@ -37,10 +36,6 @@ class PluginModel:
     def fetch_plugin_from_cmd(self) -> List[Tuple[str, str]]:
         return self._command_manager.manager_plugin.fetch_plugin_from_cmd()
 
-    def _is_substring_in_path(self, search_term: str, path: str) -> bool:
-        path_obj = Path(path)
-        return any(part == search_term for part in path_obj.parts)
-
 
 if __name__ == '__main__':
     m = PluginModel()
@@ -4,8 +4,10 @@ from pathlib import Path
 from typing import Optional
 
 import loguru
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication, QFileDialog
 
+from src.core.settings import PROJECT_PYTHON_EXE_CANDIDATES, REOPEN_OUTPUT_DIR_INTERVAL
 from src.model.basic_model import BasicModel
 from src.signal_bus import SignalBus
 from src.utils.singleton import singleton
@@ -16,6 +18,9 @@ from src.view.basic_view import BasicView
 
 @singleton
 class BasicPresenter:
+    # 保留 __weakref__: PySide 连接普通对象的绑定方法时需要对其创建弱引用
+    __slots__ = ('_view', '_model', '_window_explorer_utils', '_signal_bus', '_start_time', '_start_thread',
+                 '_scan_threads', '_file_dialog', '_last_opened_dir', '_last_open_time', '__weakref__')
 
     def __init__(self):
         self._view = BasicView()
@@ -25,9 +30,18 @@ class BasicPresenter:
         self._signal_bus = SignalBus()
 
         self._start_time: float | None = None
+        self._start_thread: RunInThread | None = None
+        # 正在运行的扫描线程，线程结束前必须保持引用，否则 QThread 会在运行中被销毁
+        self._scan_threads: set[RunInThread] = set()
+        self._file_dialog: QFileDialog | None = None
+        self._last_opened_dir: Path | None = None
+        self._last_open_time: float = 0.0
 
         self.bind()
 
+        # 第一次打开文件对话框需要初始化系统 Shell，提前在空闲时创建好，避免点击按钮时卡顿
+        QTimer.singleShot(0, self._prewarm_dialogs)
+
     # ==========================
     # 基础属性
     # ==========================
@@ -44,13 +58,6 @@ class BasicPresenter:
     # 工具方法
     # ==========================
 
-    def _safe_path(self, value) -> Optional[Path]:
-        if isinstance(value, Path):
-            return value
-        if isinstance(value, str) and value.strip():
-            return Path(value)
-        return None
-
     def _ensure_output_dir(self, path: Path):
         try:
             path.mkdir(parents=True, exist_ok=True)
@@ -58,6 +65,42 @@ class BasicPresenter:
             loguru.logger.error(f'创建输出目录失败: {e}')
             self._view.show_error_infobar('错误', '创建输出目录失败')
 
+    def _set_output_dir(self, path: Path):
+        # is_dir 只需一次 stat，目录已存在时不再调用 mkdir
+        if not path.is_dir():
+            self._ensure_output_dir(path)
+
+        self._model.output_dir = path
+        self._view.output_dir = path
+
+    def _prewarm_dialogs(self):
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self._view)
+
+    def _exec_file_dialog(self, caption: str, name_filter: str = '',
+                          file_mode: QFileDialog.FileMode = QFileDialog.FileMode.ExistingFile) -> Optional[str]:
+        """复用同一个文件对话框，返回选择的路径，取消则返回 None"""
+        self._prewarm_dialogs()
+        dialog = self._file_dialog
+        dialog.setWindowTitle(caption)
+        dialog.setFileMode(file_mode)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, file_mode == QFileDialog.FileMode.Directory)
+        dialog.setNameFilter(name_filter)
+
+        if dialog.exec() != QFileDialog.DialogCode.Accepted:
+            return None
+        selected_files = dialog.selectedFiles()
+        return selected_files[0] if selected_files else None
+
+    def _open_output_dir(self, output_dir: Path):
+        """打开输出文件夹，短时间内重复打包到同一文件夹时不再重复打开资源管理器"""
+        now = time.monotonic()
+        if output_dir == self._last_opened_dir and now - self._last_open_time < REOPEN_OUTPUT_DIR_INTERVAL:
+            return
+        self._last_opened_dir = output_dir
+        self._last_open_time = now
+        os.startfile(output_dir)
+
     def _get_output_dir_path(self) -> Path:
         if not self._model.source_script_path:
             return Path.cwd() / 'output'
@@ -84,39 +127,49 @@ class BasicPresenter:
         self._model.source_script_path = drop_file_path
         self._view.source_script_path = drop_file_path
 
-        output_dir = self._get_output_dir_path()
-        self._ensure_output_dir(output_dir)
-
-        self._model.output_dir = output_dir
-        self._view.output_dir = output_dir
+        self._set_output_dir(self._get_output_dir_path())
 
         self._view.show_success_infobar('成功', f'已选择文件: {drop_file_path.name}', duration=2000)
 
-        # 查找虚拟环境 python.exe
-        project_python_exe = self._window_explorer_utils.find_files_in_dir_recursive(
-            drop_file_path.parent,
+        # 查找虚拟环境 python.exe 可能要遍历整个项目目录，放到子线程避免卡住界面
+        # 用户可能在上一次扫描结束前再次拖入文件，所以每次扫描使用单独的线程
+        scan_thread = RunInThread()
+        scan_thread.set_start_func(self._scan_project_env, drop_file_path.parent)
+        scan_thread.set_finished_func(self._on_env_scanned)
+        # RunInThread 在内部 QThread 结束并销毁后才会销毁，此时再释放引用
+        scan_thread.destroyed.connect(lambda: self._scan_threads.discard(scan_thread))
+        self._scan_threads.add(scan_thread)
+        scan_thread.start()
+
+    def _scan_project_env(self, project_dir: Path) -> tuple[Path, Optional[Path]]:
+        """子线程中运行，先检查常见的虚拟环境位置，找到第一个就停止"""
+        project_python_exe = self._window_explorer_utils.find_first_file(
+            project_dir,
             'python.exe',
-            WindowExplorerUtils.FileType.FILES
+            candidates=PROJECT_PYTHON_EXE_CANDIDATES
         )
+        return project_dir, project_python_exe
+
+    def _on_env_scanned(self, result: tuple[Path, Optional[Path]]):
+        project_dir, project_python_exe = result
 
+        # 扫描期间用户可能已经换了文件
+        source_script_path = self._model.source_script_path
+        if not source_script_path or source_script_path.parent != project_dir:
+            return
+
+        # find_first_file 从 project_dir 开始查找, 返回值一定在项目目录内
         if project_python_exe:
-            project_python_exe = project_python_exe[0]
-            if Path(project_python_exe).is_relative_to(drop_file_path.parent):
-                self._view.show_mask_dialog(
-                    '已找到项目 Python.exe',
-                    f'检测到虚拟环境, 是否使用:\n{project_python_exe}'
-                )
-                self._model.project_python_exe_path = project_python_exe
-                self._signal_bus.update_setting_view.emit()
+            self._view.show_mask_dialog(
+                '已找到项目 Python.exe',
+                f'检测到虚拟环境, 是否使用:\n{project_python_exe}'
+            )
+            self._model.project_python_exe_path = project_python_exe
+            self._signal_bus.update_setting_view.emit()
 
     def _open_file_dialog(self):
 
-        py_file, _ = QFileDialog.getOpenFileName(
-            self._view,
-            '选择 Python 文件',
-            '',
-            'Python 文件 (*.py)'
-        )
+        py_file = self._exec_file_dialog('选择 Python 文件', 'Python 文件 (*.py)')
 
         if not py_file:
             self._view.show_warning_infobar('错误', '未选择任何文件')
@@ -130,34 +183,22 @@ class BasicPresenter:
             self._view.show_warning_infobar('错误', '请先选择 Python 文件')
             return
 
-        output_path = QFileDialog.getExistingDirectory(self._view, '选择输出路径', '')
+        output_path = self._exec_file_dialog('选择输出路径', file_mode=QFileDialog.FileMode.Directory)
 
         if not output_path:
-            default_path = self._get_output_dir_path()
-            self._ensure_output_dir(default_path)
-
-            self._view.output_dir = default_path
-            self._model.output_dir = default_path
+            self._set_output_dir(self._get_output_dir_path())
 
             self._view.show_warning_infobar('提示', '未选择文件夹, 已使用默认路径')
             return
 
         output_path = Path(output_path)
-        self._ensure_output_dir(output_path)
-
-        self._view.output_dir = output_path
-        self._model.output_dir = output_path
+        self._set_output_dir(output_path)
 
         loguru.logger.info(f'选择输出路径为: {output_path}')
 
     def _icon_changed(self):
 
-        icon_path, _ = QFileDialog.getOpenFileName(
-            self._view,
-            '选择图标文件',
-            '',
-            '图标文件 (*.ico)'
-        )
+        icon_path = self._exec_file_dialog('选择图标文件', '图标文件 (*.ico)')
 
         if not icon_path:
             self._model.icon_path = None
@@ -185,7 +226,7 @@ class BasicPresenter:
             self._view.show_warning_infobar('错误', '请先选择 Python 文件')
             return
 
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
 
         def start():
             return self._model.start()
@@ -197,7 +238,7 @@ class BasicPresenter:
                 self._view.finish_state_tooltip('失败', '打包任务失败')
                 return
 
-            duration = time.time() - self._start_time if self._start_time else 0
+            duration = time.perf_counter() - self._start_time if self._start_time is not None else 0
 
             self._view.show_success_infobar(
                 '完成',
@@ -209,7 +250,7 @@ class BasicPresenter:
             self._view.finish_state_tooltip('就绪', '打包完成')
 
             if self._model.output_dir:
-                os.startfile(self._model.output_dir)
+                self._open_output_dir(self._model.output_dir)
 
             QApplication.alert(self._view)
 
@@ -0,0 +1,38 @@
+from enum import Enum
+from typing import Dict
+
+from PySide6.QtCore import QFile
+from PySide6.QtGui import QIcon
+
+from src.core.settings import PRERENDER_ICONS
+from src.resource import rc_res
+
+rc_res = rc_res  # 防止格式化的时候资源文件被删除
+
+
+class AppIcon(Enum):
+    SOFTWARE = 0
+
+
+# 每个图标对应的 svg 资源，在 PRERENDER_ICONS 中的 svg 会优先使用 scripts/qrc2py.py 预渲染的 png
+_ICON_FILES: Dict[AppIcon, str] = {
+    AppIcon.SOFTWARE: ":/Icons/materialIcons/software_icon.svg",
+}
+_ICONS: Dict[AppIcon, QIcon] = {}
+
+
+def _get_icon_file(svg_file: str) -> str:
+    """返回图标实际使用的资源文件，资源文件重新编译之前 rc_res 中没有 png，回退到 svg"""
+    if svg_file in PRERENDER_ICONS:
+        png_file = svg_file[:-len('.svg')] + '.png'
+        if QFile.exists(png_file):
+            return png_file
+    return svg_file
+
+
+def get(icon: AppIcon) -> QIcon:
+    """获取图标，第一次使用时创建，之后所有页面共用同一个 QIcon"""
+    if icon not in _ICONS:
+        # 只注册 png 时使用位图引擎，会自动加载同名的 @2x 文件，不需要解析 svg
+        _ICONS[icon] = QIcon(_get_icon_file(_ICON_FILES[icon]))
+    return _ICONS[icon]
@@ -1,44 +1,325 @@
 import ast
+import atexit
+import codecs
+import os
+import pickle
+import re
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from src.core.paths import IMPORTS_CACHE_FILE
+from src.utils.window_explorer_utils import WindowExplorerUtils
+
+# 提取规则变化时需要递增，使旧的磁盘缓存失效
+_CACHE_VERSION = 6
+# (文件路径, mtime_ns, size, strict, include_lazy) -> 去重后的 import 列表
+_CACHE: Optional[Dict[Tuple[str, int, int, bool, bool], List[str]]] = None
+_CACHE_DIRTY = False
+# 本次运行中查询过的文件 -> (mtime_ns, size)，文件不存在时为 None，保存时据此丢弃过期的缓存
+_CACHE_SEEN: Dict[str, Optional[Tuple[int, int]]] = {}
+# 磁盘缓存最多保存的条数，超出时丢弃最久没有用到的
+_CACHE_MAX_ENTRIES = 50000
+# 同一个包名在整个项目中会出现很多次，驻留后所有文件共用同一个字符串对象
+_intern = sys.intern
+# 未命中缓存的文件少于该数量时直接串行解析，避免线程池/进程池的启动开销
+_PARALLEL_THRESHOLD = 32
+
+# 行首或 `;` 之后的 `from xxx import yyy, zzz` 或 `import xxx, yyy as zzz`
+_IMPORT_RE = re.compile(
+    rb'(?:^|;)[ \t]*(?:from[ \t]+([\w.]+)[ \t]+import[ \t]+\(?[ \t]*([\w.][\w., \t]*)?'
+    rb'|import[ \t]+([\w.][\w., \t]*))',
+    re.M)
 
-class DependenceUtils:
-    @staticmethod
-    def get_import_name_from_py_file(file_path: Path) -> List[str]:
-        import_names = []
 
-        # 1️⃣ 读取文件（防止编码炸）
+def _load_cache() -> Dict[Tuple[str, int, int, bool, bool], List[str]]:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = {}
         try:
-            with file_path.open('r', encoding='utf-8', errors='ignore') as file:
-                file_content = file.read()
-        except Exception as e:
-            print(f"[DependenceUtils] 读取失败: {file_path} -> {e}")
-            return []
+            with IMPORTS_CACHE_FILE.open('rb') as file:
+                data = pickle.load(file)
+            if data.get('version') == _CACHE_VERSION:
+                _CACHE = data['entries']
+        except Exception:
+            pass
+        atexit.register(_save_cache)
+    return _CACHE
+
+
+def _prune_cache(cache: Dict[Tuple[str, int, int, bool, bool], List[str]]
+                 ) -> Dict[Tuple[str, int, int, bool, bool], List[str]]:
+    """去掉本次运行中发现已删除或已修改文件的缓存，并限制缓存条数
+
+    只对比查询时记录的文件状态，不重新 stat，避免退出时遍历整个缓存卡住界面
+    """
+    pruned = {}
+    for cache_key, import_names in cache.items():
+        file_path = cache_key[0]
+        if file_path not in _CACHE_SEEN or _CACHE_SEEN[file_path] == cache_key[1:3]:
+            pruned[cache_key] = import_names
+
+    if len(pruned) > _CACHE_MAX_ENTRIES:
+        pruned = dict(list(pruned.items())[-_CACHE_MAX_ENTRIES:])
+    return pruned
+
+
+def _save_cache() -> None:
+    if not _CACHE_DIRTY or _CACHE is None:
+        return
+    try:
+        entries = _prune_cache(_CACHE)
+        IMPORTS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # 先写临时文件再替换，写入中途被结束时不会留下损坏的缓存
+        temp_file = IMPORTS_CACHE_FILE.with_name(IMPORTS_CACHE_FILE.name + '.tmp')
+        with temp_file.open('wb') as file:
+            pickle.dump({'version': _CACHE_VERSION, 'entries': entries}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, IMPORTS_CACHE_FILE)
+    except Exception as e:
+        print(f"[DependenceUtils] 缓存写入失败: {IMPORTS_CACHE_FILE} -> {e}")
+
+
+class _ImportCollector(ast.NodeVisitor):
+    """只遍历语句层级收集 import 的顶层包名，不进入表达式节点
+
+    NodeVisitor 按节点类名直接分派到 visit_xxx，不需要逐个 isinstance 判断；
+    只会深入 if/try/with/for/while/match 等语句块，函数体/类体中的延迟导入默认跳过
+    """
+
+    def __init__(self, include_lazy: bool = False):
+        self.include_lazy = include_lazy
+        # 用 dict 按出现顺序去重
+        self.names: Dict[str, None] = {}
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.names[_intern(alias.name.split('.', 1)[0])] = None
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.names[_intern(node.module.split('.', 1)[0])] = None
+        else:
+            # 相对导入：from . import xxx
+            for alias in node.names:
+                self.names[_intern(alias.name.split('.', 1)[0])] = None
+
+    def _visit_body(self, node: ast.AST):
+        for field in ('body', 'handlers', 'orelse', 'finalbody'):
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def _visit_lazy_body(self, node: ast.AST):
+        if self.include_lazy:
+            self._visit_body(node)
+
+    def visit_Match(self, node: ast.AST):
+        for case in node.cases:
+            self._visit_body(case)
+
+    visit_Module = visit_If = visit_Try = visit_TryStar = visit_ExceptHandler = _visit_body
+    visit_For = visit_AsyncFor = visit_While = visit_With = visit_AsyncWith = _visit_body
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _visit_lazy_body
+
+    def generic_visit(self, node: ast.AST):
+        # 其他语句和表达式中不会出现 import 语句
+        pass
+
+
+def _iter_scraped_names(data: bytes) -> Iterator[str]:
+    for match in _IMPORT_RE.finditer(data):
+        start = match.start()
+        # `;` 之前同一行出现 `#` 时，这里是注释内容
+        if data[start:start + 1] == b';' and data.rfind(b'#', data.rfind(b'\n', 0, start) + 1, start) != -1:
+            continue
+        from_module, from_names, modules = match.groups()
+        if modules is None:
+            module = from_module.lstrip(b'.')
+            if module:
+                yield _intern(module.split(b'.', 1)[0].decode('ascii'))
+                continue
+            # 相对导入：from . import xxx, yyy
+            modules = from_names or b''
+        for module in modules.split(b','):
+            module = module.split()
+            if module:
+                yield _intern(module[0].split(b'.', 1)[0].decode('ascii'))
+
+
+def _scrape_imports(data: bytes) -> List[str]:
+    """用正则逐行匹配 import，不构建 AST
+
+    已知的局限，需要完全准确时使用 AST 解析：
+    - 续行和括号换行的多行 import 只能识别到第一行中的名字
+    - 文档字符串、多行字符串中以 import 开头的文字也会被当作导入
+    - 字符串中 `;` 之后的 import 文字也会被当作导入
+    - 同一行 `;` 之前的字符串里含有 `#` 时，`;` 之后的导入会被当作注释跳过
+    """
+    # Windows 下保存的文件常带 UTF-8 BOM，不去掉的话第一行的 import 匹配不到行首
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+    return list(dict.fromkeys(_iter_scraped_names(data)))  # 按出现顺序去重
+
 
-        # 2️⃣ 解析 AST（防止语法炸）
+def _parse_imports(file_path: Path, include_lazy: bool) -> Optional[List[str]]:
+    # 1️⃣ 读取文件，直接交给 ast.parse 按 PEP 263 编码声明解码
+    try:
+        data = file_path.read_bytes()
+    except OSError as e:
+        print(f"[DependenceUtils] 读取失败: {file_path} -> {e}")
+        return None
+
+    # 2️⃣ 解析 AST（防止语法炸）
+    try:
         try:
-            tree = ast.parse(file_content)
-        except SyntaxError as e:
-            print(f"[DependenceUtils] 跳过语法错误文件: {file_path}")
-            print(f"  -> {e}")
+            tree = ast.parse(data, filename=str(file_path))
+        except SyntaxError:
+            # 没有编码声明的非 UTF-8 文件（如 GBK）会解码失败，忽略无法解码的字符后重试
+            tree = ast.parse(data.decode('utf-8', errors='ignore'), filename=str(file_path))
+    except SyntaxError as e:
+        print(f"[DependenceUtils] 跳过语法错误文件: {file_path}")
+        print(f"  -> {e}")
+        return None
+    except Exception as e:
+        print(f"[DependenceUtils] AST解析异常: {file_path} -> {e}")
+        return None
+
+    # 3️⃣ 提取 import（只扫描模块层级及 if/try/with/for/while/match 块），按出现顺序去重
+    collector = _ImportCollector(include_lazy)
+    collector.visit(tree)
+    return list(collector.names)
+
+
+def _collect_imports(file_path: Path, strict: bool, include_lazy: bool) -> Optional[List[str]]:
+    """读取并解析单个文件，失败时返回 None（不写入缓存）"""
+    if strict:
+        return _parse_imports(file_path, include_lazy)
+    try:
+        return _scrape_imports(file_path.read_bytes())
+    except Exception as e:
+        print(f"[DependenceUtils] 读取失败: {file_path} -> {e}")
+        return None
+
+
+def _get_cache_key(file_path: Path, strict: bool, include_lazy: bool) -> Optional[Tuple[str, int, int, bool, bool]]:
+    try:
+        st = file_path.stat()
+    except Exception as e:
+        _CACHE_SEEN[str(file_path)] = None
+        print(f"[DependenceUtils] 读取失败: {file_path} -> {e}")
+        return None
+    _CACHE_SEEN[str(file_path)] = (st.st_mtime_ns, st.st_size)
+    return str(file_path), st.st_mtime_ns, st.st_size, strict, include_lazy
+
+
+def _get_cached(cache: Dict[Tuple[str, int, int, bool, bool], List[str]],
+                cache_key: Tuple[str, int, int, bool, bool]) -> Optional[List[str]]:
+    """读取缓存，命中时移到末尾，超出条数限制时优先丢弃最久没有用到的"""
+    import_names = cache.pop(cache_key, None)
+    if import_names is not None:
+        cache[cache_key] = import_names
+    return import_names
+
+
+class DependenceUtils:
+    @staticmethod
+    def get_import_name_from_py_file(file_path: Path, strict: bool = False, include_lazy: bool = False) -> List[str]:
+        """获取 py 文件中导入的顶层包名
+
+        Args:
+            file_path: py 文件路径
+            strict: 使用 AST 解析，能正确处理续行、括号换行等情况，但速度较慢
+            include_lazy: 仅 strict 模式下有效，是否包含函数体和类体中的延迟导入
+        """
+        global _CACHE_DIRTY
+
+        # 0️⃣ 命中缓存则跳过读取和解析（文件未修改）
+        cache_key = _get_cache_key(file_path, strict, include_lazy)
+        if cache_key is None:
             return []
-        except Exception as e:
-            print(f"[DependenceUtils] AST解析异常: {file_path} -> {e}")
+        cache = _load_cache()
+        import_names = _get_cached(cache, cache_key)
+        if import_names is not None:
+            return list(import_names)
+
+        import_names = _collect_imports(file_path, strict, include_lazy)
+        if import_names is None:
             return []
 
-        # 3️⃣ 提取 import
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    import_names.append(alias.name.split('.')[0])
-
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    import_names.append(node.module.split('.')[0])
-                else:
-                    # 相对导入：from . import xxx
-                    for alias in node.names:
-                        import_names.append(alias.name.split('.')[0])
-
-        return list(set(import_names))  # 去重
+        cache[cache_key] = import_names
+        _CACHE_DIRTY = True
+        return list(import_names)
+
+    @staticmethod
+    def get_import_names_for_paths(paths: Iterable[Path], strict: bool = False, include_lazy: bool = False,
+                                   max_workers: Optional[int] = None) -> Dict[Path, List[str]]:
+        """批量获取多个 py 文件中导入的顶层包名
+
+        未命中缓存的文件较多时并行读取和解析：
+        默认的正则模式耗时主要在读取文件，使用线程池；
+        strict 模式的 AST 解析受 GIL 限制，使用进程池。子进程会重新导入主模块，
+        入口脚本需要有 `if __name__ == "__main__":` 保护并调用 multiprocessing.freeze_support()
+
+        Args:
+            paths: py 文件路径
+            strict: 同 get_import_name_from_py_file
+            include_lazy: 同 get_import_name_from_py_file
+            max_workers: 线程池/进程池大小，默认为 CPU 核心数
+
+        Returns:
+            Dict[Path, List[str]]: 文件路径 -> 导入的顶层包名
+        """
+        global _CACHE_DIRTY
+        cache = _load_cache()
+        result: Dict[Path, List[str]] = {}
+        misses: List[Tuple[Path, Tuple[str, int, int, bool, bool]]] = []
+
+        for path in paths:
+            cache_key = _get_cache_key(path, strict, include_lazy)
+            if cache_key is None:
+                result[path] = []
+                continue
+            import_names = _get_cached(cache, cache_key)
+            if import_names is not None:
+                result[path] = list(import_names)
+            else:
+                misses.append((path, cache_key))
+
+        if not misses:
+            return result
+
+        miss_paths = [path for path, _ in misses]
+        if len(misses) < _PARALLEL_THRESHOLD:
+            all_import_names = [_collect_imports(path, strict, include_lazy) for path in miss_paths]
+        else:
+            executor_class: type[Executor] = ProcessPoolExecutor if strict else ThreadPoolExecutor
+            try:
+                with executor_class(max_workers=max_workers or os.cpu_count()) as executor:
+                    all_import_names = list(executor.map(_collect_imports, miss_paths, repeat(strict),
+                                                         repeat(include_lazy), chunksize=16))
+            except Exception as e:
+                print(f"[DependenceUtils] 并行解析失败, 改为串行解析 -> {e}")
+                all_import_names = [_collect_imports(path, strict, include_lazy) for path in miss_paths]
+
+        for (path, cache_key), import_names in zip(misses, all_import_names):
+            if import_names is None:
+                result[path] = []
+                continue
+            cache[cache_key] = import_names
+            _CACHE_DIRTY = True
+            result[path] = list(import_names)
+        return result
+
+    @staticmethod
+    def walk_py_imports(root: Path, excluded: Iterable[str] = (), strict: bool = False,
+                        include_lazy: bool = False) -> Iterator[Tuple[Path, List[str]]]:
+        """边遍历文件夹边解析，逐个产出 (文件路径, 导入的顶层包名)
+
+        调用方可以在遍历尚未结束时就开始处理结果，需要并行解析时把
+        WindowExplorerUtils.iter_file_entries 得到的 py 文件交给 get_import_names_for_paths
+        """
+        for entry in WindowExplorerUtils.iter_file_entries(root, excluded):
+            if entry.name.endswith('.py'):
+                path = Path(entry.path)
+                yield path, DependenceUtils.get_import_name_from_py_file(path, strict, include_lazy)
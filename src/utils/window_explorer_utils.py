@@ -1,8 +1,11 @@
 import ctypes
 import fnmatch
+import os
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional
+
+from src.core.settings import FIND_FILE_IGNORE_DIRS
 
 
 class FILETIME(ctypes.Structure):
@@ -245,6 +248,60 @@ class WindowExplorerUtils:
 
         return found_files
 
+    @staticmethod
+    def find_first_file(source_dir_path: Path, search_file_name: str,
+                        excluded: Iterable[str] = FIND_FILE_IGNORE_DIRS,
+                        candidates: Iterable[str] = ()) -> Optional[Path]:
+        """查找第一个文件名为 search_file_name 的文件，找到后立即返回
+
+        Args:
+            source_dir_path: 查找的根目录
+            search_file_name: 完整的文件名，例如 python.exe
+            excluded: 不进入的文件夹名
+            candidates: 相对于根目录的常见位置（支持通配符），会在全量查找之前优先检查
+
+        Returns:
+            Optional[Path]: 找到的文件路径，没有找到则返回 None
+        """
+        for candidate in candidates:
+            for file_path in source_dir_path.glob(candidate):
+                if file_path.is_file():
+                    return file_path
+
+        for entry in WindowExplorerUtils.iter_file_entries(source_dir_path, excluded):
+            if entry.name == search_file_name:
+                return Path(entry.path)
+        return None
+
+    @staticmethod
+    def iter_file_entries(source_dir_path: Path, excluded: Iterable[str] = ()) -> Iterator[os.DirEntry]:
+        """使用 os.scandir 递归遍历文件，不进入 excluded 中的文件夹
+
+        scandir 返回的条目自带文件类型，判断文件/文件夹时不需要额外的 stat；
+        逐个产出，调用方找到需要的文件后可以直接停止遍历
+
+        Args:
+            source_dir_path: 遍历的根目录
+            excluded: 不进入的文件夹名
+
+        Returns:
+            Iterator[os.DirEntry]: 文件（不包含文件夹）的条目
+        """
+        excluded = set(excluded)
+        stack = [source_dir_path]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in excluded:
+                                stack.append(Path(entry.path))
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+            except OSError as e:
+                print(f"Error scanning directory {current_dir}: {e}")
+
     def get_dir_size(self, source_dir_path: Path) -> float:
         """获取文件夹大小，单位为MB"""
         total_size = 0
@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QWidget, QApplication
 from src.interface.Ui_about_page_fluent import Ui_Form
+from src.resource.icons import AppIcon, get
 import webbrowser
 
 
@@ -7,8 +8,20 @@ class AboutView(QWidget):
     def __init__(self):
         super().__init__()
 
+        # 关于页很少被打开，控件树延迟到第一次显示时再构建
         self.ui = Ui_Form()
+        self._is_ui_built: bool = False
+
+    def showEvent(self, event):
+        if not self._is_ui_built:
+            self._build_ui()
+        super().showEvent(event)
+
+    def _build_ui(self):
+        self._is_ui_built = True
         self.ui.setupUi(self)
+        # 图标不写在 ui 文件里，直接使用和其他页面共用的 QIcon
+        self.ui.IconWidget.setIcon(get(AppIcon.SOFTWARE))
 
         self.ui.HyperlinkButton.clicked.connect(self._open_my_website)
 
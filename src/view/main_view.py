@@ -1,9 +1,9 @@
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 from qfluentwidgets import FluentIcon as FIF
 from qfluentwidgets import FluentWindow, NavigationItemPosition
 
 from src.component.cmd_text_edit import CMDTextEdit
+from src.resource.icons import AppIcon, get
 from src.view.about_view import AboutView
 from src.view.advanced_view import AdvancedView
 from src.view.args_view import ArgsView
@@ -70,7 +70,7 @@ class MainView(FluentWindow):
         self.resize(1100, 750)
         # 设置窗口的最小尺寸
         self.setMinimumSize(1100, 750)
-        self.setWindowIcon(QIcon(":/Icons/materialIcons/software_icon.svg"))
+        self.setWindowIcon(get(AppIcon.SOFTWARE))
         self.setWindowTitle("NuitkaGUI")
 
         desktop = QApplication.screens()[0].availableGeometry()
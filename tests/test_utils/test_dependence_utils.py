@@ -1,12 +1,29 @@
 import os
+import pickle
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from src.utils import dependence_utils
 from src.utils.dependence_utils import DependenceUtils
 
 
 class TestDependenceUtils(unittest.TestCase):
+    def setUp(self):
+        # 使用临时的缓存文件和空缓存，避免读写用户目录下的真实缓存
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.cache_file = Path(cache_dir.name) / "imports.pkl"
+        for patcher in (
+            mock.patch.object(dependence_utils, "IMPORTS_CACHE_FILE", self.cache_file),
+            mock.patch.object(dependence_utils, "_CACHE", {}),
+            mock.patch.object(dependence_utils, "_CACHE_DIRTY", False),
+            mock.patch.object(dependence_utils, "_CACHE_SEEN", {}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def test_imports_from_simple_file(self):
         content = "import os\nimport sys"
         with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
@@ -47,6 +64,163 @@ class TestDependenceUtils(unittest.TestCase):
         self.assertEqual(result, [])
         os.remove(temp_file_path)
 
+    def test_imports_from_multi_name_import(self):
+        content = "import os.path as osp, json\nfrom .pkg.sub import thing\n"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+        self.assertEqual(sorted(result), ["json", "os", "pkg"])
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True)
+        self.assertEqual(sorted(result), ["json", "os", "pkg"])
+        os.remove(temp_file_path)
+
+    def test_strict_imports_from_non_utf8_file(self):
+        content = "# 中文注释\nimport json\n"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("gbk"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True)
+        self.assertEqual(result, ["json"])
+        os.remove(temp_file_path)
+
+    def test_imports_from_semicolon_and_relative_name_list(self):
+        content = "import os; import sys\nfrom . import alpha, beta as b\nfrom . import (gamma, delta)\n"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+        self.assertEqual(result, ["os", "sys", "alpha", "beta", "gamma", "delta"])
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True)
+        self.assertEqual(result, ["os", "sys", "alpha", "beta", "gamma", "delta"])
+        os.remove(temp_file_path)
+
+    def test_imports_from_file_with_bom(self):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write("import bom\nimport os\n".encode("utf-8-sig"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+        self.assertEqual(result, ["bom", "os"])
+        os.remove(temp_file_path)
+
+    def test_semicolon_import_in_comment_ignored(self):
+        content = "x = 1  # ; import fake\ny = 2; import real\n"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+        self.assertEqual(result, ["real"])
+        os.remove(temp_file_path)
+
+    def test_lazy_imports_skipped_by_default(self):
+        content = "try:\n    import json\nexcept ImportError:\n    json = None\n\ndef f():\n    import csv\n"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True)
+        self.assertEqual(result, ["json"])
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True, include_lazy=True)
+        self.assertEqual(sorted(result), ["csv", "json"])
+        os.remove(temp_file_path)
+
+    def test_strict_imports_inside_compound_statements(self):
+        content = (
+            "for _ in range(1):\n    import in_for\n"
+            "while False:\n    import in_while\nelse:\n    import in_while_else\n"
+            "match 1:\n    case 1:\n        import in_match\n"
+            "async def f():\n    async with ctx:\n        import in_async_with\n"
+            "    async for _ in ctx:\n        import in_async_for\n"
+        )
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True)
+        self.assertEqual(result, ["in_for", "in_while", "in_while_else", "in_match"])
+        result = DependenceUtils.get_import_name_from_py_file(temp_file_path, strict=True, include_lazy=True)
+        self.assertEqual(result, ["in_for", "in_while", "in_while_else", "in_match", "in_async_with", "in_async_for"])
+        os.remove(temp_file_path)
+
+    def test_cached_result_skips_parse(self):
+        content = "import json"
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".py") as temp_file:
+            temp_file.write(content.encode("utf-8"))
+            temp_file_path = Path(temp_file.name)
+
+        first = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+        with mock.patch("src.utils.dependence_utils._scrape_imports") as scrape:
+            second = DependenceUtils.get_import_name_from_py_file(temp_file_path)
+            scrape.assert_not_called()
+        self.assertEqual(first, ["json"])
+        self.assertEqual(second, ["json"])
+        os.remove(temp_file_path)
+
+    def test_imports_for_paths(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for index in range(40):
+                path = Path(temp_dir) / f"module_{index}.py"
+                path.write_text(f"import os\nimport pkg_{index}\n", encoding="utf-8")
+                paths.append(path)
+
+            for strict in (False, True):
+                result = DependenceUtils.get_import_names_for_paths(paths, strict=strict, max_workers=2)
+                self.assertEqual(list(result), paths)
+                for index, path in enumerate(paths):
+                    self.assertEqual(result[path], ["os", f"pkg_{index}"])
+
+    def test_walk_py_imports_skips_excluded_dirs(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "pkg").mkdir()
+            (root / "venv").mkdir()
+            (root / "main.py").write_text("import json\n", encoding="utf-8")
+            (root / "pkg" / "sub.py").write_text("import csv\n", encoding="utf-8")
+            (root / "venv" / "site.py").write_text("import os\n", encoding="utf-8")
+            (root / "notes.txt").write_text("import re\n", encoding="utf-8")
+
+            result = dict(DependenceUtils.walk_py_imports(root, excluded=["venv"]))
+            self.assertEqual(result, {root / "main.py": ["json"], root / "pkg" / "sub.py": ["csv"]})
+
+    def test_save_cache_prunes_deleted_and_modified_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            kept = Path(temp_dir) / "kept.py"
+            modified = Path(temp_dir) / "modified.py"
+            deleted = Path(temp_dir) / "deleted.py"
+            kept.write_text("import json\n", encoding="utf-8")
+            modified.write_text("import csv\n", encoding="utf-8")
+            deleted.write_text("import csv\n", encoding="utf-8")
+            DependenceUtils.get_import_names_for_paths([kept, modified, deleted])
+            modified.write_text("import csv, re\n", encoding="utf-8")
+            deleted.unlink()
+            DependenceUtils.get_import_names_for_paths([modified, deleted])
+
+            dependence_utils._save_cache()
+            with self.cache_file.open("rb") as file:
+                entries = pickle.load(file)["entries"]
+            self.assertEqual([key[0] for key in entries], [str(kept), str(modified)])
+            self.assertEqual(list(entries.values())[-1], ["csv", "re"])
+            self.assertFalse(self.cache_file.with_name(self.cache_file.name + ".tmp").exists())
+
+    def test_save_cache_keeps_recently_used_entries(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / f"module_{i}.py" for i in range(3)]
+            for path in paths:
+                path.write_text("import os\n", encoding="utf-8")
+            DependenceUtils.get_import_names_for_paths(paths)
+            DependenceUtils.get_import_name_from_py_file(paths[0])
+
+            with mock.patch.object(dependence_utils, "_CACHE_MAX_ENTRIES", 2):
+                dependence_utils._save_cache()
+            with self.cache_file.open("rb") as file:
+                entries = pickle.load(file)["entries"]
+            self.assertEqual([key[0] for key in entries], [str(paths[2]), str(paths[0])])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.utils.window_explorer_utils import WindowExplorerUtils
+
+
+class TestFindFirstFile(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = Path(temp_dir.name)
+
+    def _touch(self, relative_path: str) -> Path:
+        file_path = self.root / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("", encoding="utf-8")
+        return file_path
+
+    def test_candidates_checked_before_walk(self):
+        self._touch("deep/nested/python.exe")
+        candidate = self._touch("venv/Scripts/python.exe")
+
+        with mock.patch.object(WindowExplorerUtils, "iter_file_entries") as iter_file_entries:
+            result = WindowExplorerUtils.find_first_file(
+                self.root, "python.exe", candidates=["missing/python.exe", "venv/*/python.exe"]
+            )
+        self.assertEqual(result, candidate)
+        iter_file_entries.assert_not_called()
+
+    def test_excluded_dirs_skipped(self):
+        self._touch("node_modules/python.exe")
+        self._touch("site-packages/pkg/python.exe")
+
+        self.assertIsNone(WindowExplorerUtils.find_first_file(self.root, "python.exe"))
+        self.assertEqual(
+            WindowExplorerUtils.find_first_file(self.root, "python.exe", excluded=["site-packages"]),
+            self.root / "node_modules" / "python.exe",
+        )
+
+    def test_walk_stops_at_first_match(self):
+        for i in range(5):
+            self._touch(f"file_{i}.txt")
+        self._touch("python.exe")
+        self._touch("sub/other.txt")
+        visited = []
+        iter_file_entries = WindowExplorerUtils.iter_file_entries
+
+        def recording_iter(*args, **kwargs):
+            for entry in iter_file_entries(*args, **kwargs):
+                visited.append(entry.name)
+                yield entry
+
+        with mock.patch.object(WindowExplorerUtils, "iter_file_entries", side_effect=recording_iter):
+            result = WindowExplorerUtils.find_first_file(self.root, "python.exe")
+        self.assertEqual(result, self.root / "python.exe")
+        self.assertEqual(visited[-1], "python.exe")
+        # 根目录中找到后不再进入子目录
+        self.assertNotIn("other.txt", visited)
+
+
+if __name__ == "__main__":
+    unittest.main()